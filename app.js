@@ -36,13 +36,16 @@ const TYPE_INFO = {
 };
 const TYPE_FALLBACK = { label: 'Other', category: 'Other', symbol: 'diamond', color: '#FFEAA7' };
 
+// Marker style per type code, built once so chart rebuilds are pure lookups.
+const styleOf = t => ({ symbol: t.symbol, color: t.color, size: MARKER_SIZE });
+const OBJECT_STYLES  = Object.fromEntries(
+  Object.entries(TYPE_INFO).map(([code, t]) => [code, styleOf(t)])
+);
+const STYLE_FALLBACK = styleOf(TYPE_FALLBACK);
+
 function typeInfo(code)      { return TYPE_INFO[code] || TYPE_FALLBACK; }
 function typeLabel(code)     { return typeInfo(code).label; }
-function getObjectStyle(code) {
-  const t = typeInfo(code);
-  return { symbol: t.symbol, color: t.color, size: MARKER_SIZE };
-}
-function classifyObjectType(code) { return typeInfo(code).category; }
+function getObjectStyle(code) { return OBJECT_STYLES[code] || STYLE_FALLBACK; }
 
 // Broad category for a human-readable Type label (used when grouping the Type
 // filter, whose values are labels rather than codes).
@@ -51,6 +54,13 @@ const LABEL_TO_CATEGORY = Object.fromEntries(
 );
 function categoryOfLabel(label) { return LABEL_TO_CATEGORY[label] || 'Other'; }
 
+// Category display order, and every type label sorted by (category, label) —
+// the order sky-chart traces and their legend groups are emitted in.
+const CATEGORY_ORDER = ['Galaxy', 'Nebula', 'Cluster', 'Other'];
+const TYPE_ORDER = CATEGORY_ORDER.flatMap(cat =>
+  [...new Set(Object.values(TYPE_INFO).filter(t => t.category === cat).map(t => t.label))].sort()
+);
+
 // ─── Star data ────────────────────────────────────────────────────────────────
 // [name, ra_deg, dec_deg, magnitude, constellation]
 
@@ -286,6 +296,12 @@ const CONSTELLATION_LINES = {
   },
 };
 
+// Constellation label text and hover, independent of projection — built once.
+const CONSTELLATION_NAMES = Object.keys(CONSTELLATION_LINES);
+const CONSTELLATION_HOVER = CONSTELLATION_NAMES.map(n =>
+  `<b>${n}</b><br>${CONSTELLATION_LINES[n].messierObjects.length} Messier objects`
+);
+
 // ─── Projection math ──────────────────────────────────────────────────────────
 
 let currentProjection = 'equirectangular';
@@ -487,6 +503,9 @@ function getLayout() {
     paper_bgcolor: '#0B1426',
     plot_bgcolor:  '#0B1426',
     font: { color: 'white', family: 'Arial, Helvetica, sans-serif' },
+    // Keep the user's zoom/pan and legend toggles across filter redraws;
+    // switching projection or search isolation resets the view.
+    uirevision: `${currentProjection}|${searchSelection || ''}`,
     legend: {
       yanchor: 'top', y: 0.99,
       xanchor: 'left', x: 1.01,
@@ -545,130 +564,152 @@ const PLOTLY_CONFIG = {
   modeBarButtonsToRemove: ['lasso2d', 'select2d'],
 };
 
-function buildTraces(data, options) {
-  const traces = [];
-
-  // 0. Reference grid (Mollweide / Stereographic only)
-  traces.push(...buildGridTraces());
-
-  // 1. Constellation lines
-  if (options.showConstellationLines) {
-    for (const [name, cdata] of Object.entries(CONSTELLATION_LINES)) {
-      for (const polyline of cdata.lines) {
-        const coords = projectPolyline(polyline);
-        traces.push({
-          type: 'scatter', x: coords.x, y: coords.y,
-          mode: 'lines',
-          line: { color: 'rgba(128,128,128,0.4)', width: 1 },
-          showlegend: false, hoverinfo: 'skip',
-          name: `${name} lines`,
-        });
-      }
+// The grid, constellation lines, bright stars and constellation labels depend
+// only on the projection, never on the filtered catalog, so build them once per
+// projection and reuse them on every redraw. Plotly.react also skips re-diffing
+// arrays it has already seen by reference.
+const staticTraceCache = {};
+
+function getStaticTraces() {
+  if (staticTraceCache[currentProjection]) return staticTraceCache[currentProjection];
+
+  // Constellation lines — every polyline in ONE trace, separated by nulls
+  // (connectgaps off), rather than a trace per polyline.
+  const lx = [], ly = [];
+  for (const cdata of Object.values(CONSTELLATION_LINES)) {
+    for (const polyline of cdata.lines) {
+      const coords = projectPolyline(polyline);
+      lx.push(...coords.x, null);
+      ly.push(...coords.y, null);
     }
   }
 
-  // 2. Bright stars — store original RA/Dec in customdata so hover shows real coords
+  // Bright stars — store original RA/Dec in customdata so hover shows real coords
   const starPts = BRIGHT_STARS.map(s => projectPoint(s[1], s[2]));
-  traces.push({
-    type: 'scatter',
-    x: starPts.map(p => p.x),
-    y: starPts.map(p => p.y),
-    mode: options.showStarLabels ? 'markers+text' : 'markers',
-    marker: { size: 4, color: 'lightgray', symbol: 'star' },
-    text: BRIGHT_STARS.map(s => s[0]),
-    textposition: 'top center',
-    textfont: { size: 6, color: 'lightgray', family: 'Arial, Helvetica, sans-serif' },
-    name: 'Bright Stars',
-    showlegend: false,
-    hovertemplate:
-      '<b>%{customdata[0]}</b><br>' +
-      'Constellation: %{customdata[1]}<br>' +
-      'RA: %{customdata[3]:.1f}°  Dec: %{customdata[4]:.1f}°<br>' +
-      'Mag: %{customdata[2]:.2f}<extra></extra>',
-    customdata: BRIGHT_STARS.map(s => [s[0], s[4], s[3], s[1], s[2]]),
-  });
 
-  // 3. Constellation name labels
-  if (options.showConstellationLabels) {
-    const names   = Object.keys(CONSTELLATION_LINES);
-    const labelPts = names.map(n => projectPoint(...CONSTELLATION_LINES[n].labelPos));
-    traces.push({
+  const labelPts = CONSTELLATION_NAMES.map(n => projectPoint(...CONSTELLATION_LINES[n].labelPos));
+
+  return staticTraceCache[currentProjection] = {
+    // Every trace carries a stable uid so uirevision matches legend state
+    // (e.g. a hidden type) by identity, not by index — layers come and go as
+    // toggles and filters change.
+    grid: buildGridTraces().map((t, i) => ({ ...t, uid: `grid-${i}` })),
+    lines: {
+      uid: 'constellation-lines',
+      type: 'scatter', x: lx, y: ly,
+      mode: 'lines', connectgaps: false,
+      line: { color: 'rgba(128,128,128,0.4)', width: 1 },
+      showlegend: false, hoverinfo: 'skip',
+      name: 'Constellation lines',
+    },
+    stars: {
+      uid: 'bright-stars',
+      type: 'scatter',
+      x: starPts.map(p => p.x),
+      y: starPts.map(p => p.y),
+      marker: { size: 4, color: 'lightgray', symbol: 'star' },
+      text: BRIGHT_STARS.map(s => s[0]),
+      textposition: 'top center',
+      textfont: { size: 6, color: 'lightgray', family: 'Arial, Helvetica, sans-serif' },
+      name: 'Bright Stars',
+      showlegend: false,
+      hovertemplate:
+        '<b>%{customdata[0]}</b><br>' +
+        'Constellation: %{customdata[1]}<br>' +
+        'RA: %{customdata[3]:.1f}°  Dec: %{customdata[4]:.1f}°<br>' +
+        'Mag: %{customdata[2]:.2f}<extra></extra>',
+      customdata: BRIGHT_STARS.map(s => [s[0], s[4], s[3], s[1], s[2]]),
+    },
+    labels: {
+      uid: 'constellation-labels',
       type: 'scatter',
       x: labelPts.map(p => p.x),
       y: labelPts.map(p => p.y),
-      mode: 'text', text: names,
+      mode: 'text', text: CONSTELLATION_NAMES,
       textposition: 'middle center',
       textfont: { size: 12, color: 'rgba(200,200,200,0.8)', family: 'Arial, Helvetica, sans-serif' },
       name: 'Constellation Labels',
       showlegend: false,
       hovertemplate: '%{customdata}<extra></extra>',
-      customdata: names.map(n =>
-        `<b>${n}</b><br>${CONSTELLATION_LINES[n].messierObjects.length} Messier objects`
-      ),
-    });
-  }
+      customdata: CONSTELLATION_HOVER,
+    },
+  };
+}
+
+function buildTraces(data, options) {
+  const traces = [];
+  const fixed  = getStaticTraces();
+
+  // 0. Reference grid (Mollweide / Stereographic only)
+  traces.push(...fixed.grid);
+
+  // 1. Constellation lines
+  if (options.showConstellationLines) traces.push(fixed.lines);
+
+  // 2. Bright stars (the label toggle only changes the trace mode)
+  traces.push({ ...fixed.stars, mode: options.showStarLabels ? 'markers+text' : 'markers' });
 
-  // 4. Messier objects grouped by category then type
-  const byCategory = {};
+  // 3. Constellation name labels
+  if (options.showConstellationLabels) traces.push(fixed.labels);
+
+  // 4. Messier objects grouped by type in one pass, emitted in TYPE_ORDER
+  // (category, then type) so legend groups stay together.
+  const byType = new Map();
   for (const obj of data) {
-    const cat = obj.category;
-    if (!byCategory[cat]) byCategory[cat] = {};
-    if (!byCategory[cat][obj.objectType]) byCategory[cat][obj.objectType] = [];
-    byCategory[cat][obj.objectType].push(obj);
+    let group = byType.get(obj.objectType);
+    if (!group) byType.set(obj.objectType, group = []);
+    group.push(obj);
   }
 
   // With the full NGC+IC catalog a trace can hold thousands of points, so use
   // WebGL (scattergl) for the object markers; grid/lines/stars stay on SVG.
-  for (const category of ['Galaxy', 'Nebula', 'Cluster', 'Other']) {
-    if (!byCategory[category]) continue;
-    for (const objType of Object.keys(byCategory[category]).sort()) {
-      // Tonight's Sky: only show objects currently above the horizon
-      const objects = options.lst !== null
-        ? byCategory[category][objType].filter(o =>
-            getAltitudeDeg(o.raDeg, o.decDeg, options.lst, options.lat) > -0.5)
-        : byCategory[category][objType];
-      if (!objects.length) continue;
-
-      const style   = getObjectStyle(objects[0].typeCode);
-      const objPts  = objects.map(o => projectPoint(o.raDeg, o.decDeg));
-      const markerSize = options.scaleSizeByMag
-        ? objects.map(o => magToSize(o.magnitudeVal))
-        : style.size;
-      // Labels: only for label-worthy objects, and only when not suppressed by
-      // the overcrowding guard.
-      const labels = options.showObjectLabels
-        ? objects.map(o => o.labelWorthy ? o.label : '')
-        : objects.map(() => '');
+  for (const objType of TYPE_ORDER) {
+    const group = byType.get(objType);
+    if (!group) continue;
+    const category = categoryOfLabel(objType);
+    // Tonight's Sky: only show objects currently above the horizon
+    const objects = options.lst !== null
+      ? group.filter(o =>
+          getAltitudeDeg(o.raDeg, o.decDeg, options.lst, options.lat) > -0.5)
+      : group;
+    if (!objects.length) continue;
+
+    const style   = getObjectStyle(objects[0].typeCode);
+    const objPts  = objects.map(o => projectPoint(o.raDeg, o.decDeg));
+    const markerSize = options.scaleSizeByMag
+      ? objects.map(o => magToSize(o.magnitudeVal))
+      : style.size;
+    // Labels: only for label-worthy objects, and only when not suppressed by
+    // the overcrowding guard.
+    const labels = options.showObjectLabels
+      ? objects.map(o => o.labelWorthy ? o.label : '')
+      : objects.map(() => '');
 
-      traces.push({
-        type: 'scattergl',
-        x: objPts.map(p => p.x),
-        y: objPts.map(p => p.y),
-        mode: 'markers+text',
-        marker: {
-          size: markerSize, color: style.color, symbol: style.symbol,
-          line: { width: 0.6, color: 'rgba(255,255,255,0.7)' },
-        },
-        name: objType,
-        text: labels,
-        textposition: 'top center',
-        textfont: { size: 8, color: 'white', family: 'Arial, Helvetica, sans-serif' },
-        hovertemplate:
-          '<b>%{customdata[0]}</b><br>' +
-          'Type: %{customdata[2]}<br>' +
-          'Constellation: %{customdata[3]}<br>' +
-          'Magnitude: %{customdata[4]}<br>' +
-          'Best Viewing: %{customdata[5]}<br>' +
-          'RA: %{customdata[6]:.1f}°  Dec: %{customdata[7]:.1f}°<extra></extra>',
-        customdata: objects.map(o => [
-          o.label, o.name, o.objectType, o.constellation,
-          o.magnitude, o.season, o.raDeg, o.decDeg,
-          o.dimensions, o.id, o.allIds.join(' · '), o.catalog,
-        ]),
-        legendgroup: category,
-        legendgrouptitle: { text: category },
-      });
-    }
+    traces.push({
+      uid: objType,
+      type: 'scattergl',
+      x: objPts.map(p => p.x),
+      y: objPts.map(p => p.y),
+      mode: 'markers+text',
+      marker: {
+        size: markerSize, color: style.color, symbol: style.symbol,
+        line: { width: 0.6, color: 'rgba(255,255,255,0.7)' },
+      },
+      name: objType,
+      text: labels,
+      textposition: 'top center',
+      textfont: { size: 8, color: 'white', family: 'Arial, Helvetica, sans-serif' },
+      hovertemplate:
+        '<b>%{customdata[0]}</b><br>' +
+        'Type: %{customdata[1]}<br>' +
+        'Constellation: %{customdata[2]}<br>' +
+        'Magnitude: %{customdata[3]}<br>' +
+        'Best Viewing: %{customdata[4]}<br>' +
+        'RA: %{customdata[5]:.1f}°  Dec: %{customdata[6]:.1f}°<extra></extra>',
+      customdata: objects.map(o => o.hoverData),
+      legendgroup: category,
+      legendgrouptitle: { text: category },
+    });
   }
 
   return traces;
@@ -936,7 +977,7 @@ function closeDetailPanel() {
 // Accepts either an object id (string) or the object itself.
 function openDetailPanel(objOrId) {
   const obj = (typeof objOrId === 'string')
-    ? allData.find(o => o.id === objOrId)
+    ? objectsById.get(objOrId)
     : objOrId;
   if (!obj) return;
 
@@ -1035,6 +1076,7 @@ const MAX_PLANNER_OBJECTS = 60;
 const CATALOG_ORDER = ['Messier', 'Caldwell', 'NGC', 'IC', 'Other'];
 
 let allData          = [];
+let objectsById      = new Map();   // id → object, for O(1) lookups from clicks/search
 let allTypes         = [];
 let allConstellations = [];
 let allSeasons       = [];
@@ -1070,14 +1112,20 @@ function getFilteredData() {
   // Search isolation overrides every other filter so any object is always
   // findable — the filter chips stay set underneath and return on clear.
   if (searchSelection) {
-    const o = allData.find(x => x.id === searchSelection);
+    const o = objectsById.get(searchSelection);
     return o ? [o] : [];
   }
+  // A filter with every value selected (the default) can't reject anything,
+  // so skip its per-object lookup entirely.
+  const checkCatalog = selectedCatalogs.size       < allCatalogs.length;
+  const checkType    = selectedTypes.size          < allTypes.length;
+  const checkConst   = selectedConstellations.size < allConstellations.length;
+  const checkSeason  = selectedSeasons.size        < allSeasons.length;
   return allData.filter(obj => {
-    if (!selectedCatalogs.has(obj.catalog)) return false;
-    if (!selectedTypes.has(obj.objectType)) return false;
-    if (!selectedConstellations.has(obj.constellation)) return false;
-    if (!selectedSeasons.has(obj.season)) return false;
+    if (checkCatalog && !selectedCatalogs.has(obj.catalog)) return false;
+    if (checkType    && !selectedTypes.has(obj.objectType)) return false;
+    if (checkConst   && !selectedConstellations.has(obj.constellation)) return false;
+    if (checkSeason  && !selectedSeasons.has(obj.season)) return false;
     // Angular-size filter: hide objects known to be smaller than sizeMin. Objects
     // with no measured size (point sources, unmeasured) pass through so we never
     // drop a real object for lack of a measurement.
@@ -1138,28 +1186,41 @@ function updateChart() {
   syncCheckboxes('type-checkboxes',   selectedTypes);
   syncCheckboxes('const-checkboxes',  selectedConstellations);
   syncCheckboxes('season-checkboxes', selectedSeasons);
-  updatePlanner();
+  updatePlanner(filtered);
 }
 
-function syncCheckboxes(containerId, selectedSet) {
-  document.querySelectorAll(`#${containerId} input[type=checkbox]`).forEach(cb => {
-    if (cb.dataset.master) return;  // category master toggles handled below
-    cb.checked = selectedSet.has(cb.value);
-  });
-  // Refresh category master toggles (checked / indeterminate) from their members.
-  document.querySelectorAll(`#${containerId} input[data-master]`).forEach(master => {
-    const cat = master.dataset.master;
-    const types = [...container_type_values(containerId)].filter(t => categoryOfLabel(t) === cat);
-    const selCount = types.filter(t => selectedSet.has(t)).length;
-    master.checked       = types.length > 0 && selCount === types.length;
-    master.indeterminate = selCount > 0 && selCount < types.length;
+// Range sliders fire 'input' far faster than the chart can redraw while being
+// dragged; coalesce those into at most one updateChart() per animation frame.
+let chartUpdateFrame = 0;
+function scheduleChartUpdate() {
+  if (chartUpdateFrame) return;
+  chartUpdateFrame = requestAnimationFrame(() => {
+    chartUpdateFrame = 0;
+    updateChart();
   });
 }
 
-// All per-type checkbox values currently rendered in a container.
-function container_type_values(containerId) {
-  return [...document.querySelectorAll(`#${containerId} input[type=checkbox]:not([data-master])`)]
-    .map(cb => cb.value);
+function syncCheckboxes(containerId, selectedSet) {
+  // One pass over the rendered boxes: sync each type and, in containers with
+  // category master toggles (only the Type list), tally its category; then
+  // refresh the masters (checked / indeterminate) from that tally.
+  const boxes   = document.querySelectorAll(`#${containerId} input[type=checkbox]`);
+  const masters = [...boxes].filter(cb => cb.dataset.master);
+  const tally = masters.length ? {} : null;   // category → { total, selected }
+  boxes.forEach(cb => {
+    if (cb.dataset.master) return;
+    cb.checked = selectedSet.has(cb.value);
+    if (!tally) return;
+    const cat = categoryOfLabel(cb.value);
+    const t = tally[cat] || (tally[cat] = { total: 0, selected: 0 });
+    t.total++;
+    if (cb.checked) t.selected++;
+  });
+  for (const master of masters) {
+    const { total, selected } = tally[master.dataset.master] || { total: 0, selected: 0 };
+    master.checked       = total > 0 && selected === total;
+    master.indeterminate = selected > 0 && selected < total;
+  }
 }
 
 function buildCheckboxes(containerId, options, selectedSet) {
@@ -1213,8 +1274,7 @@ function buildCheckboxes(containerId, options, selectedSet) {
     input.addEventListener('change', () => {
       if (input.checked) types.forEach(t => selectedSet.add(t));
       else               types.forEach(t => selectedSet.delete(t));
-      buildCheckboxes(containerId, options, selectedSet);
-      updateChart();
+      updateChart();   // syncCheckboxes() refreshes the member boxes in place
     });
     const label = document.createElement('label');
     label.className   = 'form-check-label';
@@ -1227,7 +1287,7 @@ function buildCheckboxes(containerId, options, selectedSet) {
   }
 
   if (isTypeList && grouped) {
-    for (const cat of ['Galaxy', 'Nebula', 'Cluster', 'Other']) {
+    for (const cat of CATEGORY_ORDER) {
       if (!grouped[cat].length) continue;
       addCategoryHeader(cat, grouped[cat]);
       grouped[cat].sort().forEach(addCheckbox);
@@ -1237,15 +1297,15 @@ function buildCheckboxes(containerId, options, selectedSet) {
   }
 }
 
-function setupSelectAll(btnId, deselBtnId, allValues, selectedSet, containerId) {
+// The checkboxes are built once in init(); these only change the selection and
+// let updateChart() → syncCheckboxes() tick the existing boxes.
+function setupSelectAll(btnId, deselBtnId, allValues, selectedSet) {
   document.getElementById(btnId).addEventListener('click', () => {
     allValues.forEach(v => selectedSet.add(v));
-    buildCheckboxes(containerId, allValues, selectedSet);
     updateChart();
   });
   document.getElementById(deselBtnId).addEventListener('click', () => {
     selectedSet.clear();
-    buildCheckboxes(containerId, allValues, selectedSet);
     updateChart();
   });
 }
@@ -1253,27 +1313,21 @@ function setupSelectAll(btnId, deselBtnId, allValues, selectedSet, containerId)
 // ─── Collapse icon sync ───────────────────────────────────────────────────────
 
 function setupCollapseIcons() {
-  for (const [collapseId, iconId] of [
-    ['catalog-collapse', 'catalog-icon'],
-    ['type-collapse',   'type-icon'],
-    ['const-collapse',  'const-icon'],
-    ['season-collapse', 'season-icon'],
-    ['mag-collapse',    'mag-icon'],
-  ]) {
-    const el = document.getElementById(collapseId);
-    el.addEventListener('show.bs.collapse', () => { document.getElementById(iconId).textContent = '▼ '; });
-    el.addEventListener('hide.bs.collapse', () => { document.getElementById(iconId).textContent = '▶ '; });
-  }
+  // Each filter section is wired once; expand/collapse-all reuse the same
+  // resolved Collapse instances instead of re-querying every section by id.
+  const sections = ['catalog', 'type', 'const', 'season', 'mag'].map(key => {
+    const el   = document.getElementById(`${key}-collapse`);
+    const icon = document.getElementById(`${key}-icon`);
+    el.addEventListener('show.bs.collapse', () => { icon.textContent = '▼ '; });
+    el.addEventListener('hide.bs.collapse', () => { icon.textContent = '▶ '; });
+    return bootstrap.Collapse.getOrCreateInstance(el, { toggle: false });
+  });
 
   document.getElementById('expand-all').addEventListener('click', () => {
-    ['catalog-collapse', 'type-collapse', 'const-collapse', 'season-collapse', 'mag-collapse'].forEach(id =>
-      bootstrap.Collapse.getOrCreateInstance(document.getElementById(id)).show()
-    );
+    sections.forEach(c => c.show());
   });
   document.getElementById('collapse-all').addEventListener('click', () => {
-    ['catalog-collapse', 'type-collapse', 'const-collapse', 'season-collapse', 'mag-collapse'].forEach(id =>
-      bootstrap.Collapse.getOrCreateInstance(document.getElementById(id)).hide()
-    );
+    sections.forEach(c => c.hide());
   });
 }
 
@@ -1344,7 +1398,7 @@ function centerSkyChartOn(obj) {
 
 function isolateObject(id) {
   searchSelection = id;
-  const obj = allData.find(o => o.id === id);
+  const obj = objectsById.get(id);
   const desig = obj ? (obj.messier || obj.caldwell || obj.ngcIc || obj.id) : id;
   const chipLabel = obj && obj.name && obj.name !== desig ? `${desig} · ${obj.name}` : desig;
   document.getElementById('search-chip-label').textContent = chipLabel;
@@ -1435,26 +1489,30 @@ function parseCSV(csvText) {
     const label = messier || caldwell || name || ngcIc;
     const labelWorthy = !!(messier || caldwell || name ||
       (Number.isFinite(magVal) && magVal <= LABEL_MAG_BRIGHT));
-    return {
+    const obj = {
       id:            (row['id'] || '').trim(),
       catalog:       (row['catalog'] || 'Other').trim(),
       messier, caldwell, name, ngcIc, label, labelWorthy,
       allIds:        (row['all_ids'] || ngcIc).split(',').map(s => s.trim()).filter(Boolean),
       typeCode:      code,
       objectType:    typeLabel(code),
-      category:      classifyObjectType(code),
       magnitude:     magStr === '' ? '—' : magStr,
       magnitudeVal:  magVal,
-      hasMag:        Number.isFinite(magVal),
-      distance:      '',
       constellation: (row['constellation'] || 'Unknown').trim(),
       dimensions:    (row['size_arcmin'] || '').trim(),
       sizeArcminVal: parseFloat(row['size_arcmin']),   // NaN when size is unknown
-      bestViewing:   season,
       season,
       raDeg:  parseFloat(row['ra_deg'])  || 0,
       decDeg: parseFloat(row['dec_deg']) || 0,
     };
+    // Sky-chart hover/click payload, built once here rather than on every
+    // redraw. Only the fields the hovertemplate and click handler read — it is
+    // serialized for every plotted point.
+    obj.hoverData = [
+      obj.label, obj.objectType, obj.constellation, obj.magnitude,
+      obj.season, obj.raDeg, obj.decDeg, obj.id,
+    ];
+    return obj;
   });
 }
 
@@ -1480,7 +1538,7 @@ async function init() {
   sizeMinEl.addEventListener('input', () => {
     sizeMin = parseFloat(sizeMinEl.value);
     sizeMinLabel.textContent = sizeMin.toFixed(1) + '′';
-    updateChart();
+    scheduleChartUpdate();
   });
 
   // Single limiting-magnitude slider: caps the faint end at magMax. magMin stays
@@ -1496,7 +1554,7 @@ async function init() {
   magMaxEl.addEventListener('input', () => {
     magMax = parseFloat(magMaxEl.value);
     magMaxLabel.textContent = magMax.toFixed(1);
-    updateChart();
+    scheduleChartUpdate();
   });
 
   // Scale-by-magnitude toggle
@@ -1599,14 +1657,23 @@ async function init() {
   }
 
   allData = parseCSV(csvText);
+  objectsById = new Map(allData.map(o => [o.id, o]));
   buildSearchIndex();
   setupSearch();
 
-  allCatalogs       = CATALOG_ORDER.filter(c => allData.some(o => o.catalog === c));
-  allTypes          = [...new Set(allData.map(o => o.objectType))].sort();
-  allConstellations = [...new Set(allData.map(o => o.constellation))].sort();
+  // Collect every filter's distinct values in a single pass over the catalog.
+  const catalogs = new Set(), types = new Set(), consts = new Set(), seasons = new Set();
+  for (const o of allData) {
+    catalogs.add(o.catalog);
+    types.add(o.objectType);
+    consts.add(o.constellation);
+    seasons.add(o.season);
+  }
+  allCatalogs       = CATALOG_ORDER.filter(c => catalogs.has(c));
+  allTypes          = [...types].sort();
+  allConstellations = [...consts].sort();
   const SEASON_ORDER = ['Winter', 'Spring', 'Summer', 'Autumn', 'Unknown'];
-  allSeasons        = SEASON_ORDER.filter(s => allData.some(o => o.season === s));
+  allSeasons        = SEASON_ORDER.filter(s => seasons.has(s));
 
   allCatalogs.forEach(c => selectedCatalogs.add(c));
   allTypes.forEach(t => selectedTypes.add(t));
@@ -1618,10 +1685,10 @@ async function init() {
   buildCheckboxes('const-checkboxes',  allConstellations, selectedConstellations);
   buildCheckboxes('season-checkboxes', allSeasons,        selectedSeasons);
 
-  setupSelectAll('select-all-catalog', 'deselect-all-catalog', allCatalogs,       selectedCatalogs,      'catalog-checkboxes');
-  setupSelectAll('select-all-types',   'deselect-all-types',   allTypes,          selectedTypes,         'type-checkboxes');
-  setupSelectAll('select-all-const',   'deselect-all-const',   allConstellations, selectedConstellations, 'const-checkboxes');
-  setupSelectAll('select-all-seasons', 'deselect-all-seasons', allSeasons,        selectedSeasons,        'season-checkboxes');
+  setupSelectAll('select-all-catalog', 'deselect-all-catalog', allCatalogs,       selectedCatalogs);
+  setupSelectAll('select-all-types',   'deselect-all-types',   allTypes,          selectedTypes);
+  setupSelectAll('select-all-const',   'deselect-all-const',   allConstellations, selectedConstellations);
+  setupSelectAll('select-all-seasons', 'deselect-all-seasons', allSeasons,        selectedSeasons);
 
   document.getElementById('loading-msg').remove();
   initPlanner();
@@ -1632,11 +1699,11 @@ async function init() {
   document.getElementById('panel-backdrop').addEventListener('click', closeDetailPanel);
 
   // Plotly click → open detail panel. Object traces carry the object id at
-  // customdata[9]; bright stars (length 5) and label/line traces don't.
+  // customdata[7]; bright stars (length 5) and label/line traces don't.
   document.getElementById('sky-chart').on('plotly_click', data => {
     const pt = data.points[0];
-    if (!pt.customdata || pt.customdata.length < 10) return;
-    openDetailPanel(pt.customdata[9]);
+    if (!Array.isArray(pt.customdata) || pt.customdata.length < 8) return;
+    openDetailPanel(pt.customdata[7]);
   });
 
   // Detect the observer's location on load so the visibility chart reflects
@@ -2114,9 +2181,11 @@ function buildSkyPathChart(filteredData) {
   });
 }
 
-function updatePlanner() {
+// Callers that have just filtered (updateChart) pass their result along so the
+// catalog isn't filtered twice per interaction.
+function updatePlanner(filtered) {
   if (currentTab !== 'planner') return;
-  const data = getFilteredData();
+  const data = filtered || getFilteredData();
   document.getElementById('planner-chart').style.display    = plannerView === 'gantt'    ? '' : 'none';
   document.getElementById('planner-altitude').style.display = plannerView === 'altitude' ? '' : 'none';
   document.getElementById('planner-skypath').style.display  = plannerView === 'skypath'  ? '' : 'none';
@@ -19,18 +19,24 @@ in this directory. Pass --offline to require the local copies.
 
 import argparse
 import csv
+import functools
 import math
 import os
 import re
 import sys
-import urllib.request
+from types import MappingProxyType
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 REPO = os.path.dirname(HERE)
 OUT_PATH = os.path.join(REPO, "catalog.csv")
 
 OPENNGC_BASE = "https://raw.githubusercontent.com/mattiaverga/OpenNGC/master/database_files/"
-SOURCE_FILES = ["NGC.csv", "addendum.csv"]
+SOURCE_FILES = ("NGC.csv", "addendum.csv")
+
+# Columns of the emitted catalog.csv, in order (app.js parses it by header).
+OUT_FIELDS = ("id", "catalog", "messier", "caldwell", "ngc_ic", "name", "all_ids",
+              "type", "mag", "constellation", "size_arcmin", "ra_deg", "dec_deg",
+              "season")
 
 # Observer latitude for the "Best Viewing" season calc (issue #6). Kept generic
 # so the generator stays catalog-agnostic.
@@ -38,11 +44,11 @@ SEASON_LAT_DEG = 40.0
 SEASON_LON_DEG = 0.0  # longitude cancels out of a season (peak-month) calc
 
 # Rows that aren't real, distinct observable targets.
-DROP_TYPES = {"Dup", "NonEx"}
+DROP_TYPES = frozenset({"Dup", "NonEx"})
 
 # IAU 3-letter constellation abbreviations -> full English names (app filters +
 # constellation lines key off full names).
-CONSTELLATIONS = {
+CONSTELLATIONS = MappingProxyType({
     "And": "Andromeda", "Ant": "Antlia", "Aps": "Apus", "Aqr": "Aquarius",
     "Aql": "Aquila", "Ara": "Ara", "Ari": "Aries", "Aur": "Auriga",
     "Boo": "Boötes", "Cae": "Caelum", "Cam": "Camelopardalis", "Cnc": "Cancer",
@@ -67,7 +73,7 @@ CONSTELLATIONS = {
     "TrA": "Triangulum Australe", "Tuc": "Tucana", "UMa": "Ursa Major",
     "UMi": "Ursa Minor", "Vel": "Vela", "Vir": "Virgo", "Vol": "Volans",
     "Vul": "Vulpecula",
-}
+})
 
 
 # ── Astronomy (mirrors the formulas in app.js so season matches the app) ───────
@@ -106,32 +112,43 @@ def sun_ra_dec(jd):
 
 
 # Days from 1970-01-01 to the 15th of each month in a non-leap year, at 00:00 UTC.
-_MONTH_15_DAYS = [14, 45, 73, 104, 134, 165, 195, 226, 257, 287, 318, 348]
+_MONTH_15_DAYS = (14, 45, 73, 104, 134, 165, 195, 226, 257, 287, 318, 348)
 
-_MONTH_TO_SEASON = {  # Northern-hemisphere meteorological seasons
+_MONTH_TO_SEASON = MappingProxyType({  # Northern-hemisphere meteorological seasons
     12: "Winter", 1: "Winter", 2: "Winter",
     3: "Spring", 4: "Spring", 5: "Spring",
     6: "Summer", 7: "Summer", 8: "Summer",
     9: "Autumn", 10: "Autumn", 11: "Autumn",
-}
+})
 
 
-def best_viewing_season(ra_deg, dec_deg, lat_deg=SEASON_LAT_DEG, lon_deg=SEASON_LON_DEG):
-    """Peak dark-hours month -> season, using the same metric as the app's
-    monthly-visibility chart (object above 20° while the Sun is below -18°)."""
-    best_month = None
-    best_hours = -1.0
+@functools.lru_cache(maxsize=None)
+def _dark_lsts(lat_deg, lon_deg):
+    """Per month, the LSTs of the 15-min steps on the 15th when the Sun is below
+    -18°. Object-independent, so computed once rather than once per row."""
+    months = []
     for m in range(12):
         # JD at noon UTC on the 15th, then step every 15 min for 24 h.
         base_jd = 2440587.5 + _MONTH_15_DAYS[m] + 0.5
-        dark_hours = 0.0
+        lsts = []
         for step in range(96):
             jd = base_jd + step * (0.25 / 24.0)
             lst = lst_deg(jd, lon_deg)
             sra, sdec = sun_ra_dec(jd)
             if altitude_deg(sra, sdec, lst, lat_deg) < -18:
-                if altitude_deg(ra_deg, dec_deg, lst, lat_deg) > 20:
-                    dark_hours += 0.25
+                lsts.append(lst)
+        months.append(tuple(lsts))
+    return tuple(months)
+
+
+def best_viewing_season(ra_deg, dec_deg, lat_deg=SEASON_LAT_DEG, lon_deg=SEASON_LON_DEG):
+    """Peak dark-hours month -> season, using the same metric as the app's
+    monthly-visibility chart (object above 20° while the Sun is below -18°)."""
+    best_month = None
+    best_hours = -1.0
+    for m, lsts in enumerate(_dark_lsts(lat_deg, lon_deg)):
+        dark_hours = 0.25 * sum(
+            1 for lst in lsts if altitude_deg(ra_deg, dec_deg, lst, lat_deg) > 20)
         if dark_hours > best_hours:
             best_hours = dark_hours
             best_month = m + 1
@@ -164,14 +181,14 @@ def dec_to_deg(s):
 # M102's identity is historically disputed; OpenNGC records it only as a "Dup"
 # of M101. Modern catalogs assign M102 to NGC 5866 (the Spindle Galaxy), so we
 # restore it here to ship the full 110 Messier objects.
-MESSIER_OVERRIDES = {"NGC5866": 102}
+MESSIER_OVERRIDES = MappingProxyType({"NGC5866": 102})
 
 
 def messier_id(row):
-    name = row["Name"].strip()
+    name = row["Name"]
     if name in MESSIER_OVERRIDES:
         return f"M{MESSIER_OVERRIDES[name]}"
-    m = row["M"].strip()
+    m = row["M"]
     return f"M{int(m)}" if m else ""
 
 
@@ -183,17 +200,21 @@ def caldwell_id(row):
     return f"C{int(m.group(1))}" if m else ""
 
 
+NUM_SUFFIX_RE = re.compile(r"0*(\d+)([A-Za-z]*)$")
+NGC_IC_NAME_RE = re.compile(r"(NGC|IC)0*(\d+[A-Za-z]*)$")
+
+
 def _num_suffix(v):
     """'4414A' -> '4414A' with the numeric part un-zero-padded ('0224' -> '224')."""
-    m = re.match(r"0*(\d+)([A-Za-z]*)$", v.strip())
-    return f"{m.group(1)}{m.group(2)}" if m else v.strip()
+    m = NUM_SUFFIX_RE.match(v)
+    return f"{m.group(1)}{m.group(2)}" if m else v
 
 
 def ngc_ic_designation(row):
     # The primary designation is the Name (e.g. "NGC1952", "IC0434"); the
     # NGC/IC columns only cross-list objects primarily catalogued elsewhere.
-    name = row["Name"].strip()
-    m = re.match(r"(NGC|IC)0*(\d+[A-Za-z]*)$", name)
+    name = row["Name"]
+    m = NGC_IC_NAME_RE.match(name)
     if m:
         return f"{m.group(1)} {m.group(2)}"
     # addendum objects (e.g. Mel022, B033, ESO…) keep their raw name
@@ -201,13 +222,13 @@ def ngc_ic_designation(row):
 
 
 def first_common_name(row):
-    names = row["Common names"].strip()
+    names = row["Common names"]
     return names.split(",")[0].strip() if names else ""
 
 
 def magnitude(row):
     for key in ("V-Mag", "B-Mag"):
-        v = row[key].strip()
+        v = row[key]
         if v:
             try:
                 return f"{float(v):g}"
@@ -217,44 +238,58 @@ def magnitude(row):
 
 
 def build_all_ids(mess, cald, desig, common, row):
-    ids = []
     cross = []
-    if row["NGC"].strip():
+    if row["NGC"]:
         cross.append(f"NGC {_num_suffix(row['NGC'])}")
-    if row["IC"].strip():
+    if row["IC"]:
         cross.append(f"IC {_num_suffix(row['IC'])}")
-    for x in [mess, cald, desig, *cross]:
-        if x and x not in ids:
-            ids.append(x)
-    if common:
-        for nm in row["Common names"].split(","):
-            nm = nm.strip()
-            if nm and nm not in ids:
-                ids.append(nm)
+    names = (nm.strip() for nm in row["Common names"].split(",")) if common else ()
+    # dict.fromkeys dedupes in a single pass, keeping first-seen order.
+    ids = dict.fromkeys(x for x in (mess, cald, desig, *cross, *names) if x)
     return ",".join(ids)
 
 
 # ── Main ────────────────────────────────────────────────────────────────────────
 
+def _download(fname):
+    import urllib.request  # only needed when fetching; skip its import cost otherwise
+
+    url = OPENNGC_BASE + fname
+    print(f"Downloading {url} …")
+    urllib.request.urlretrieve(url, os.path.join(HERE, fname))
+
+
 def ensure_sources(offline):
-    for fname in SOURCE_FILES:
-        path = os.path.join(HERE, fname)
-        if os.path.exists(path):
-            continue
-        if offline:
-            sys.exit(f"Missing {path} and --offline was set. Download it from "
-                     f"{OPENNGC_BASE}{fname}")
-        url = OPENNGC_BASE + fname
-        print(f"Downloading {url} …")
-        urllib.request.urlretrieve(url, path)
+    missing = [f for f in SOURCE_FILES if not os.path.exists(os.path.join(HERE, f))]
+    if not missing:
+        return
+    if offline:
+        sys.exit(f"Missing {os.path.join(HERE, missing[0])} and --offline was set. "
+                 f"Download it from {OPENNGC_BASE}{missing[0]}")
+    from concurrent.futures import ThreadPoolExecutor
+
+    # The downloads are network-bound, so fetch the missing files concurrently.
+    with ThreadPoolExecutor(max_workers=len(SOURCE_FILES)) as pool:
+        list(pool.map(_download, missing))
+
+
+# The OpenNGC columns the helpers below actually read; the source has ~32.
+_USED_FIELDS = ("Name", "Type", "RA", "Dec", "Const", "MajAx", "B-Mag", "V-Mag",
+                "M", "NGC", "IC", "Identifiers", "Common names")
+
+
+def _normalized(row):
+    """Strip the used fields once up front so the helpers can use values as-is."""
+    return {k: (row[k] or "").strip() for k in _USED_FIELDS}
 
 
 def read_source():
-    rows = []
+    """Yield normalized rows from every source file; main() makes one pass, so
+    the ~14k-row source is never held in memory as a list."""
     for fname in SOURCE_FILES:
         with open(os.path.join(HERE, fname), newline="", encoding="utf-8") as f:
-            rows.extend(csv.DictReader(f, delimiter=";"))
-    return rows
+            for row in csv.DictReader(f, delimiter=";"):
+                yield _normalized(row)
 
 
 def catalog_of(mess, cald, row):
@@ -262,7 +297,7 @@ def catalog_of(mess, cald, row):
         return "Messier"
     if cald:
         return "Caldwell"
-    name = row["Name"].strip()
+    name = row["Name"]
     if name.startswith("NGC"):
         return "NGC"
     if name.startswith("IC"):
@@ -281,6 +316,7 @@ def main():
 
     out_rows = []
     dropped = skipped_coords = 0
+    n_mess = n_cald = n_named = 0
     for row in src:
         if row["Type"] in DROP_TYPES:
             dropped += 1
@@ -295,36 +331,33 @@ def main():
         cald = caldwell_id(row)
         desig = ngc_ic_designation(row)
         common = first_common_name(row)
+        n_mess += bool(mess)
+        n_cald += bool(cald)
+        n_named += bool(common)
 
         out_rows.append({
-            "id": row["Name"].strip(),
+            "id": row["Name"],
             "catalog": catalog_of(mess, cald, row),
             "messier": mess,
             "caldwell": cald,
             "ngc_ic": desig,
             "name": common,
             "all_ids": build_all_ids(mess, cald, desig, common, row),
-            "type": row["Type"].strip(),
+            "type": row["Type"],
             "mag": magnitude(row),
-            "constellation": CONSTELLATIONS.get(row["Const"].strip(), row["Const"].strip()),
-            "size_arcmin": row["MajAx"].strip(),
+            "constellation": CONSTELLATIONS.get(row["Const"], row["Const"]),
+            "size_arcmin": row["MajAx"],
             "ra_deg": f"{ra:.5f}",
             "dec_deg": f"{dec:.5f}",
             "season": best_viewing_season(ra, dec),
         })
 
-    fields = ["id", "catalog", "messier", "caldwell", "ngc_ic", "name", "all_ids",
-              "type", "mag", "constellation", "size_arcmin", "ra_deg", "dec_deg",
-              "season"]
     with open(OUT_PATH, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fields)
+        w = csv.DictWriter(f, fieldnames=OUT_FIELDS)
         w.writeheader()
         w.writerows(out_rows)
 
     # Summary
-    n_mess = sum(1 for r in out_rows if r["messier"])
-    n_cald = sum(1 for r in out_rows if r["caldwell"])
-    n_named = sum(1 for r in out_rows if r["name"])
     size_kb = os.path.getsize(OUT_PATH) / 1024
     print(f"Wrote {len(out_rows):,} objects to {OUT_PATH} ({size_kb:.0f} KB)")
     print(f"  Messier: {n_mess}   Caldwell: {n_cald}   named: {n_named}")